@@ -5,6 +5,7 @@ Use singlejson.load() to load a file.
 
 from .fileutils import (
     DEFAULT_SERIALIZATION_SETTINGS,
+    FAST_SERIALIZATION_SETTINGS,
     DefaultNotJSONSerializableError,
     FileAccessError,
     JSONDeserializationError,
@@ -29,6 +30,7 @@ except Exception:  # file not generated yet (e.g., fresh clone)
 __all__ = [
     "load",
     "DEFAULT_SERIALIZATION_SETTINGS",
+    "FAST_SERIALIZATION_SETTINGS",
     "sync",
     "JSONFile",
     "reset",
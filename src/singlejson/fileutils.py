@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+import codecs
+import hashlib
 import json
 import logging
 import os
-import shutil
 import threading
-from copy import deepcopy
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from json import dumps
-from json import load as json_load
 from json import loads as json_loads
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from types import TracebackType
 from typing import Any, TypeAlias
 
@@ -32,71 +33,279 @@ A type alias for valid top level JSON objects (only for use in default_data)
 
 PathOrSimilar = str | os.PathLike[str]
 
+# Coarsest mtime resolution of common filesystems (FAT: 2 s, HFS+: 1 s)
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
 logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
 class JsonSerializationSettings:
-    indent: int = 4
+    indent: int | None = 4
     sort_keys: bool = True
     ensure_ascii: bool = False
     encoding: str = "utf-8"
 
+    # The settings are frozen, so the arguments derived from them are
+    # computed once per instance instead of on every save.
+    @cached_property
+    def _dumps_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for :func:`json.dumps`."""
+        return {
+            "indent": self.indent,
+            "sort_keys": self.sort_keys,
+            "ensure_ascii": self.ensure_ascii,
+        }
+
+    @cached_property
+    def _is_utf8(self) -> bool:
+        """Whether :attr:`encoding` refers to UTF-8 (e.g. "utf-8", "UTF8")."""
+        return codecs.lookup(self.encoding).name == "utf-8"
+
+    @cached_property
+    def _encoder(self) -> Callable[[str], tuple[bytes, int]]:
+        """Encode function of the codec for :attr:`encoding`."""
+        return codecs.getencoder(self.encoding)
+
+    @cached_property
+    def _decoder(self) -> Callable[[bytes], tuple[str, int]]:
+        """Decode function of the codec for :attr:`encoding`."""
+        return codecs.getdecoder(self.encoding)
+
+
+@lru_cache(maxsize=1024)
+def _resolve(file: str) -> Path:
+    """
+    Resolve an absolute path, caching the result.
+
+    :param file: Absolute path
+    :return: Resolved Path
+    """
+    return Path(file).resolve()
+
 
 def abs_filename(file: PathOrSimilar) -> Path:
     """
     Return the absolute path of a file as :class:`pathlib.Path`.
+    Results are cached per process, so symlinks created or changed after a
+    path was first resolved are not picked up.
 
     :param file: File to get the absolute path of
     :return: Absolute Path of file
     """
-    return Path(file).expanduser().resolve()
+    path = os.path.expanduser(os.fspath(file))
+    if not os.path.isabs(path):
+        # Relative paths depend on the working directory, which may change
+        path = os.path.join(os.getcwd(), path)
+    return _resolve(path)
+
+
+def _dumps(obj: Any, settings: JsonSerializationSettings) -> bytes:
+    """
+    Serialize obj to encoded JSON according to settings.
+
+    :param obj: Object to serialize
+    :param settings: Serialization settings to apply
+    :return: JSON text encoded with settings.encoding
+    :raises TypeError: if obj is not JSON-serializable
+    :raises ValueError: if obj contains circular references
+    """
+    text = dumps(obj, **settings._dumps_kwargs)
+    if settings._is_utf8:
+        # str.encode has a built-in fast path for UTF-8
+        return text.encode()
+    return settings._encoder(text)[0]
+
+
+def _parse(data: bytes, settings: JsonSerializationSettings) -> Any:
+    """
+    Deserialize the raw content of a JSON file.
+    UTF-8 content is parsed from bytes without a separate decoding step.
+
+    :param data: Raw file content
+    :param settings: Serialization settings holding the file encoding
+    :return: Python representation of the JSON data
+    :raises json.JSONDecodeError: if data is not valid JSON
+    """
+    if settings._is_utf8:
+        return json_loads(data)
+    return json_loads(settings._decoder(data)[0])
+
+
+def _digest(data: bytes) -> bytes:
+    """
+    Return a short content hash used to detect unchanged file contents.
+
+    :param data: Bytes to hash
+    :return: 16 byte blake2b digest
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _has_content(path: PathOrSimilar, data: bytes, digest: bytes) -> bool:
+    """
+    Check whether the file at path contains exactly data.
+    Only reads the file if its size matches.
+
+    :param path: Path of the file to check
+    :param data: Expected content
+    :param digest: :func:`_digest` of data
+    :return: True if the file exists and its content equals data
+    """
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as file:
+            return _digest(file.read()) == digest
+    except OSError:
+        return False
+
+
+def _same_size(path: PathOrSimilar, other: PathOrSimilar) -> bool:
+    """
+    Check whether two files exist and have the same size.
+
+    :param path: Path of the first file
+    :param other: Path of the second file
+    :return: True if both files can be stat'ed and their sizes are equal
+    """
+    try:
+        return os.stat(path).st_size == os.stat(other).st_size
+    except OSError:
+        return False
+
+
+def _stat_key(path: PathOrSimilar) -> tuple[int, int, int] | None:
+    """
+    Return a (inode, size, mtime) triple identifying the current state of a file.
+    Files modified within the last :data:`_MTIME_GRANULARITY_NS` are not
+    identified: a same-size write within the same mtime tick would go unnoticed.
+
+    :param path: Path to stat
+    :return: identifying triple or None if the file cannot be stat'ed
+        or was modified too recently
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if time.time_ns() - st.st_mtime_ns < _MTIME_GRANULARITY_NS:
+        # mtime may not change on the next write, compare the content instead
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a file descriptor, retrying on short writes.
+
+    :param fd: file descriptor to write to
+    :param data: bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _fsync_dir(path: str) -> None:
+    """
+    Flush a directory entry to disk so a preceding rename survives a crash.
+    Does nothing on platforms that cannot open directories (Windows).
+
+    :param path: Directory to flush
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
-def _atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+def _atomic_write_bytes(
+    path: PathOrSimilar, data: bytes, *, durable: bool = False
+) -> None:
     """
-    Write text to a path atomically by writing to a temp file and then replacing.
-    Ensures the directory exists.
+    Write bytes to a path atomically by writing to a temp file and then replacing.
+    The parent directory must exist.
     Uses os.replace for atomicity so readers never see a partial write.
 
     :param path: Path to write to
-    :param text: Text content to write to the file
-    :param encoding: Encoding to use
+    :param data: Content to write to the file
+    :param durable:
+        Flush the data (fdatasync) before the rename and the directory after
+        it, so the new content survives a power loss. Costs latency.
     """
+    # tempfile pulls in shutil (and with it bz2, lzma, ...), import it on use
+    from tempfile import mkstemp
+
+    temp_name = None
     try:
-        if str(path.parent):  # Avoid creating ''
-            path.parent.mkdir(parents=True, exist_ok=True)
-            # write to a temp file in same directory then replace
-            with NamedTemporaryFile(
-                "w", encoding=encoding, dir=path.parent, delete=False, suffix=".tmp"
-            ) as tf:
-                tf.write(text)
-                temp_name = tf.name
-            os.replace(temp_name, path)
+        # write to a temp file in same directory then replace
+        parent = os.path.dirname(path)
+        fd, temp_name = mkstemp(dir=parent, suffix=".tmp")
+        try:
+            _write_all(fd, data)
+            if durable:
+                # Only the data needs flushing, metadata is covered by the rename
+                if hasattr(os, "fdatasync"):
+                    os.fdatasync(fd)
+                else:
+                    os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_name, path)
+        temp_name = None
+        if durable:
+            _fsync_dir(parent)
     except Exception as e:
+        if temp_name is not None:
+            # best-effort cleanup
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
         raise FileAccessError(
             f"Could not atomically write data to file '{path}'.\nError: {e}"
         ) from e
 
 
+def _atomic_write_text(path: PathOrSimilar, text: str, encoding: str = "utf-8") -> None:
+    """
+    Encode text and write it to a path atomically, see :func:`_atomic_write_bytes`.
+
+    :param path: Path to write to
+    :param text: Text content to write to the file
+    :param encoding: Encoding to use
+    """
+    _atomic_write_bytes(path, text.encode(encoding))
+
+
 def _atomic_copy_file(src: Path, dest: Path) -> None:
     """
     Copy a file into dest atomically by copying to a temp file and then replacing.
+    The parent directory of dest must exist.
 
     :param src: filepath to copy from
     :param dest: filepath to copy to
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    # create temp file name in destination dir
-    with NamedTemporaryFile("wb", dir=dest.parent, delete=False, suffix=".tmp") as tf:
-        temp_name = tf.name
+    import shutil
+    from tempfile import mkstemp
+
+    temp_name = None
     try:
+        # create temp file in destination dir
+        fd, temp_name = mkstemp(dir=dest.parent, suffix=".tmp")
+        os.close(fd)
+        # copyfile uses the platform's fast copy (e.g. sendfile on Linux)
         shutil.copyfile(src, temp_name)
         os.replace(temp_name, dest)
     except Exception as orig_e:
         # best-effort cleanup
         try:
-            if os.path.exists(temp_name):
+            if temp_name is not None and os.path.exists(temp_name):
                 os.remove(temp_name)
         except Exception as e:
             raise FileAccessError(
@@ -126,12 +335,19 @@ class JSONFile:
     """A .json file on the disk."""
 
     __path: Path  # Full absolute path
+    __path_str: str  # str(__path), used by the os functions in hot paths
     json: Any
     """Python representation of the JSON data."""
-    __default_data: SensibleTopLevelJSON | None = None
-    #: If not None, default data to use when the file at path is missing or corrupted
+    __default_bytes: bytes | None = None
+    #: Serialized default data, written when the file is missing or corrupted
+    __default_error: tuple[str, BaseException | None] | None = None
+    #: If not None, (message, cause) of why the default data is unusable in strict mode
+    __default_hash: bytes = b""
+    #: Digest of __default_bytes, used to detect files that already hold the default
     __default_path: PathOrSimilar | None = None
     #: If not None, path to JSON file to use as default data
+    __default_file: tuple[tuple[int, int, int], bytes, bytes, bool] | None = None
+    #: (stat key, content, digest, validated) of the default file when last read
     settings: JsonSerializationSettings
     """Serialization settings of this instance"""
     __auto_save: bool
@@ -148,6 +364,7 @@ class JSONFile:
         preserve: bool | None = None,
         strict: bool = False,
         load_file: bool = True,
+        async_save: bool = False,
     ) -> None:
         """
         Create a new JSONFile instance and load data from disk
@@ -175,6 +392,9 @@ class JSONFile:
         :param load_file:
             True by default, causes file to be loaded on init.
             Set to False to suppress loading.
+        :param async_save:
+            If True, :meth:`save` serializes the data and returns, the file is
+            written by a background thread. Use :meth:`flush` to wait for it.
         :raises ~singlejson.fileutils.FileAccessError:
             if file cannot be accessed (always)
         :raises ~singlejson.fileutils.JSONDeserializationError:
@@ -183,30 +403,38 @@ class JSONFile:
             if ``strict`` is True and default_data is not JSON-serializable
         """
         self.__path = abs_filename(path)
+        self.__path_str = str(self.__path)
         self.settings = settings or DEFAULT_SERIALIZATION_SETTINGS
         self.__auto_save = auto_save
         self.__preserve = bool(preserve) if preserve is not None else False
-        # Per-instance reentrant lock to make file operations thread-safe
-        self._lock = threading.RLock()
+        # Per-instance lock to make file operations thread-safe.
+        # Not reentrant: methods called with the lock held use the private
+        # implementations (e.g. __restore_default) that assume it is held.
+        self._lock = threading.Lock()
+        # Guards writing the file and the state below. Separate from _lock so
+        # the background writer does not block save(). Acquired after _lock.
+        self._write_lock = threading.Lock()
+        # Hash of the file content last read or written by this instance and
+        # the state of the file at that time. Used to skip rewriting unchanged data.
+        self._disk_hash: bytes | None = None
+        self._disk_stat: tuple[int, int, int] | None = None
+        # Whether the parent directory of the file is known to exist
+        self._parent_ensured = False
+        # Background writer for async_save. Only the latest (data, digest)
+        # snapshot is kept, consecutive saves are coalesced into one write.
+        self.__async_save = async_save
+        self._write_cond = threading.Condition()
+        self._pending: tuple[bytes, bytes] | None = None
+        self._writer: threading.Thread | None = None
+        self._write_error: Exception | None = None
 
         if default_path:
             if strict:
                 # Ensure default file can be loaded with json.loads
                 path = Path(default_path)
                 if path.exists():
-                    # Load from file
-                    try:
-                        with path.open("r", encoding=self.settings.encoding) as file:
-                            json_load(file)
-                            # If this works without errors, fine!
-                    except (PermissionError, OSError) as e:
-                        raise FileAccessError(
-                            f"Cannot access default JSON file '{path}': {e}"
-                        ) from e
-                    except Exception as e:
-                        raise DefaultNotJSONSerializableError(
-                            f"Cannot load default JSON from file '{path}': {e}"
-                        ) from e
+                    # Load from file, the content is kept to restore the default
+                    self.__read_default_file(path, validate=True)
                 else:
                     raise DefaultNotJSONSerializableError(
                         f"Default JSON file '{path}' does not exist."
@@ -215,51 +443,178 @@ class JSONFile:
             self.__default_path = abs_filename(default_path)
 
         elif default_data is not None:
-            # Default data and no default_path
-            if not isinstance(default_data, (str, list, dict)) and strict:
-                # Only throw error if strict
-                raise DefaultNotJSONSerializableError(
-                    f"Default data for '{self.__path}' is not JSON-serializable! \n"
-                    "It must be a dict, list or string! \n"
-                    f"Got type: {type(default_data)}"
-                )
-            elif isinstance(default_data, str) and strict:
-                try:
-                    json_loads(default_data)
-                    self.__default_data = deepcopy(default_data)
-                except (TypeError, ValueError, json.JSONDecodeError) as e:
-                    raise DefaultNotJSONSerializableError(
-                        f"default_data for '{self.__path}' isn't JSON-serializable!"
-                    ) from e
-            elif strict:
-                # default data is list or dict so should be valid unless
-                # it contains non-serializable types inside
-                try:
-                    dumps(
-                        default_data,
-                        indent=self.settings.indent,
-                        sort_keys=self.settings.sort_keys,
-                        ensure_ascii=self.settings.ensure_ascii,
-                    )
-                    # If this works without errors, fine!
-                    self.__default_data = deepcopy(default_data)
-                except (TypeError, ValueError, json.JSONDecodeError) as e:
-                    raise DefaultNotJSONSerializableError(
-                        f"default_data for '{self.__path}' is not "
-                        f"JSON-serializable: {e}"
-                    ) from e
-            else:
-                # No matter the validity, set default data.
-                self.__default_data = deepcopy(default_data)
+            # Default data and no default_path. Serialize once so restoring
+            # the default never has to copy or re-serialize the data.
+            self.__default_bytes, self.__default_error = self.__serialize_default(
+                default_data
+            )
+            if self.__default_error is not None and strict:
+                message, cause = self.__default_error
+                raise DefaultNotJSONSerializableError(message) from cause
         else:
             # No default specified, use empty dict
-            self.__default_data = {}
+            self.__default_bytes = b"{}"
+        if self.__default_bytes is not None:
+            self.__default_hash = _digest(self.__default_bytes)
         # Load from disk (this will create the file if needed and apply defaults)
         if load_file:
             self.reload(strict=strict, preserve=preserve)
         else:
             self.json = None
 
+    def __serialize_default(
+        self, default_data: Any
+    ) -> tuple[bytes | None, tuple[str, BaseException | None] | None]:
+        """
+        Serialize default data to encoded JSON using the instance settings.
+
+        :param default_data: default data passed to __init__
+        :return:
+            encoded JSON (None if not serializable) and (message, cause) of the
+            error to raise when the default is used with ``strict=True``
+            (None if the default is valid)
+        """
+        if isinstance(default_data, str):
+            # For string defaults, treat the text as JSON content directly
+            try:
+                data = default_data.encode(self.settings.encoding)
+            except UnicodeEncodeError as e:
+                return None, (
+                    f"default_data for '{self.__path}' cannot be encoded "
+                    f"with {self.settings.encoding}: {e}",
+                    e,
+                )
+            try:
+                json_loads(default_data)
+            except (TypeError, ValueError) as e:
+                return data, (
+                    f"default_data for '{self.__path}' isn't JSON-serializable!",
+                    e,
+                )
+            return data, None
+        try:
+            data = _dumps(default_data, self.settings)
+        except (TypeError, ValueError) as e:
+            return None, (
+                f"default_data for '{self.__path}' is not JSON-serializable: {e}",
+                e,
+            )
+        if not isinstance(default_data, (list, dict)):
+            return data, (
+                f"Default data for '{self.__path}' is not JSON-serializable! \n"
+                "It must be a dict, list or string! \n"
+                f"Got type: {type(default_data)}",
+                None,
+            )
+        return data, None
+
+    def __ensure_parent(self) -> None:
+        """
+        Create the parent directory of the file unless it is known to exist.
+
+        :raises ~singlejson.fileutils.FileAccessError:
+            if the directory cannot be created
+        """
+        if self._parent_ensured:
+            return
+        parent = self.__path.parent
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise FileAccessError(f"Cannot create directory '{parent}': {e}") from e
+        self._parent_ensured = True
+
+    def __write_atomically(self, write: Callable[[], None]) -> None:
+        """
+        Run an atomic write to the file path, creating its parent directory first.
+        The directory is only created on the first write, or again if a write
+        fails because the directory was removed in the meantime.
+
+        :param write: function performing the write
+        :raises ~singlejson.fileutils.FileAccessError:
+            if the directory cannot be created or the write fails
+        """
+        self.__ensure_parent()
+        try:
+            write()
+        except FileAccessError as e:
+            if not isinstance(e.__cause__, FileNotFoundError):
+                raise
+            # Directory disappeared since it was created, retry once
+            self._parent_ensured = False
+            self.__ensure_parent()
+            write()
+
+    def __write_bytes(self, data: bytes, durable: bool = False) -> None:
+        """
+        Atomically replace the file contents with data.
+
+        :param data: Content to write to the file
+        :param durable: see :func:`_atomic_write_bytes`
+        """
+        self.__write_atomically(
+            lambda: _atomic_write_bytes(self.__path_str, data, durable=durable)
+        )
+
+    def __cached_default_file(
+        self, default_path: Path, validated: bool
+    ) -> tuple[bytes, bytes] | None:
+        """
+        Return the content of the default file if it is cached and still current.
+        Like :meth:`save`, the cache is only trusted if the file's stat key
+        (see :func:`_stat_key`) is unchanged.
+
+        :param default_path: Path of the default file
+        :param validated: only return content that was validated as JSON
+        :return: (content, digest) or None if not cached or the file changed since
+        """
+        entry = self.__default_file
+        if entry is None or (validated and not entry[3]):
+            return None
+        key = _stat_key(default_path)
+        if key is None or key != entry[0]:
+            return None
+        return entry[1], entry[2]
+
+    def __read_default_file(
+        self, default_path: Path, validate: bool
+    ) -> tuple[bytes, bytes]:
+        """
+        Read the default file, optionally validating that it contains JSON.
+        The content is cached until the file's stat key changes.
+
+        :param default_path: Path of the default file
+        :param validate: check that the content is valid JSON
+        :return: content of the default file and its digest
+        :raises ~singlejson.fileutils.FileAccessError:
+            if the default file cannot be read
+        :raises ~singlejson.fileutils.DefaultNotJSONSerializableError:
+            if ``validate`` is True and the file does not contain valid JSON
+        """
+        cached = self.__cached_default_file(default_path, validate)
+        if cached is not None:
+            return cached
+        # stat before reading, a later change invalidates the cache entry
+        key = _stat_key(default_path)
+        try:
+            with open(default_path, "rb") as file:
+                content = file.read()
+        except OSError as e:
+            raise FileAccessError(
+                f"Cannot access default JSON file '{default_path}': {e}"
+            ) from e
+        if validate:
+            try:
+                _parse(content, self.settings)
+            except Exception as e:
+                raise DefaultNotJSONSerializableError(
+                    f"Cannot load default JSON from file '{default_path}': {e}"
+                ) from e
+        digest = _digest(content)
+        if key is not None:
+            self.__default_file = (key, content, digest, validate)
+        return content, digest
+
     @property
     def preserve(self) -> bool:
         """Whether to keep backups of existing files during recovery."""
@@ -275,6 +630,7 @@ class JSONFile:
         """
         Revert the file to the default either by copying the default to the file path
         or by writing the default data to the file.
+        Nothing is written (or preserved) if the file already holds the default.
 
         :param strict:
             if True, will throw error if file cannot be read or
@@ -289,6 +645,22 @@ class JSONFile:
             if default data is not JSON-serializable and ``strict`` is true
         :raises ~singlejson.fileutils.FileAccessError:
             if file cannot be accessed (always)
+        :raises Exception:
+            any error of an earlier save queued with ``async_save``,
+            see :meth:`flush`. The default is not restored in that case.
+        """
+        # Pending saves must not overwrite the default later on
+        self.flush()
+        with self._lock, self._write_lock:
+            self.__restore_default(strict, preserve)
+
+    def __restore_default(self, strict: bool, preserve: bool | None) -> None:
+        """
+        Implementation of :meth:`restore_default`.
+        The caller must hold ``_lock`` and ``_write_lock``.
+
+        :param strict: see :meth:`restore_default`
+        :param preserve: see :meth:`restore_default`
         """
 
         def _next_preserved_path(path: Path) -> Path:
@@ -315,106 +687,114 @@ class JSONFile:
                     f"Could not preserve existing file '{self.__path}': {e}"
                 ) from e
 
-        with self._lock:
-            if self.__default_path:
-                default_path = Path(self.__default_path)
-                if default_path.exists():
-                    # Valid default file, copy
-                    if strict:
-                        # Validate JSON is valid
-                        try:
-                            with default_path.open(
-                                "r", encoding=self.settings.encoding
-                            ) as file:
-                                json_load(file)
-                                # If this works without errors, fine!
-                        except (PermissionError, OSError) as e:
-                            raise FileAccessError(
-                                f"Cannot access default JSON file '{default_path}': {e}"
-                            ) from e
-                        except Exception as e:
-                            raise DefaultNotJSONSerializableError(
-                                f"Cannot load default JSON from file "
-                                f"'{default_path}': {e}"
-                            ) from e
-                    _preserve_current_file()
-                    _atomic_copy_file(default_path, self.__path)
+        # Content written to the file, if known without reading it back
+        content: bytes | None = None
+        if self.__default_path:
+            default_path = Path(self.__default_path)
+            if default_path.exists():
+                cached: tuple[bytes, bytes] | None
+                if strict:
+                    # Validate JSON is valid
+                    cached = self.__read_default_file(default_path, validate=True)
+                else:
+                    cached = self.__cached_default_file(default_path, validated=False)
+                    if cached is None and _same_size(self.__path_str, default_path):
+                        # The file may already hold the default, compare content
+                        cached = self.__read_default_file(default_path, validate=False)
+                if cached is not None:
+                    # Content already in memory, write it instead of copying
+                    content, digest = cached
+                    if not _has_content(self.__path_str, content, digest):
+                        _preserve_current_file()
+                        self.__write_bytes(content)
                 else:
-                    # Default file does not exist, create empty file
-                    if strict:
-                        raise DefaultNotJSONSerializableError(
-                            f"Default JSON file '{default_path}' does not exist!"
-                        )
-                    logger.warning(
-                        "Default JSON file '%s' does not exist!\nWriting empty {}!",
-                        default_path,
-                    )
                     _preserve_current_file()
-                    _atomic_write_text(
-                        self.__path, "{}", encoding=self.settings.encoding
+                    self.__write_atomically(
+                        lambda: _atomic_copy_file(default_path, self.__path)
                     )
             else:
-                if not isinstance(self.__default_data, (str, list, dict)) and strict:
+                # Default file does not exist, create empty file
+                if strict:
                     raise DefaultNotJSONSerializableError(
-                        f"Default data for '{self.__path}' is not JSON-serializable! \n"
-                        "It must be a dict, list or string! \n"
-                        f"Got type: {type(self.__default_data)}"
+                        f"Default JSON file '{default_path}' does not exist!"
                     )
-                elif isinstance(self.__default_data, str) and strict:
-                    # Validate str defaults ('{"a":1}' etc)
-                    try:
-                        json_loads(self.__default_data)
-                    except (TypeError, ValueError, json.JSONDecodeError) as e:
-                        raise DefaultNotJSONSerializableError(
-                            f"default_data for '{self.__path}' isn't JSON-serializable!"
-                        ) from e
-
-                try:
-                    if isinstance(self.__default_data, str):
-                        # For string defaults, treat the text as JSON content directly
-                        text = self.__default_data
-                        # we check if it's valid JSON above if strict=True
-                    else:
-                        text = dumps(
-                            self.__default_data,
-                            indent=self.settings.indent,
-                            sort_keys=self.settings.sort_keys,
-                            ensure_ascii=self.settings.ensure_ascii,
-                        )
-                except (TypeError, ValueError, json.JSONDecodeError) as e:
-                    if strict:
-                        raise DefaultNotJSONSerializableError(
-                            f"Default for file '{self.__path}' is not serializable!"
-                            f"\nError: {e}"
-                        ) from e
-                    logger.warning(
-                        "Default data for json file '%s' is not serializable!\n"
-                        "Got error: %s\n"
-                        "Writing empty {}!",
-                        self.__path,
-                        e,
-                    )
-                    text = "{}"
-
+                logger.warning(
+                    "Default JSON file '%s' does not exist!\nWriting empty {}!",
+                    default_path,
+                )
+                content = "{}".encode(self.settings.encoding)
                 _preserve_current_file()
-                _atomic_write_text(self.__path, text, encoding=self.settings.encoding)
-
-            # Now try loading the default we just wrote
-            try:
-                with self.__path.open("r", encoding=self.settings.encoding) as file:
-                    self.json = json_load(file)
-            except json.JSONDecodeError as e2:
-                # No need to check for strict here, we are already recovering
-                # because if strict = True JSONDeserializationError
-                # would have been raised.
+                self.__write_bytes(content)
+        else:
+            if self.__default_error is not None and strict:
+                message, cause = self.__default_error
+                raise DefaultNotJSONSerializableError(message) from cause
+            data = self.__default_bytes
+            digest = self.__default_hash
+            if data is None:
                 logger.warning(
-                    "Recovery also failed for '%s'. Falling back to empty object."
-                    "Decoding error: %s",
+                    "Default data for json file '%s' is not serializable!\n"
+                    "Got error: %s\n"
+                    "Writing empty {}!",
                     self.__path,
-                    e2,
+                    self.__default_error[1] if self.__default_error else None,
                 )
-                _atomic_write_text(self.__path, "{}", encoding=self.settings.encoding)
-                self.json = {}
+                data = "{}".encode(self.settings.encoding)
+                digest = _digest(data)
+
+            # Skip the write if the file already holds the default
+            if not _has_content(self.__path_str, data, digest):
+                _preserve_current_file()
+                self.__write_bytes(data)
+            content = data
+
+        # Now try loading the default we just wrote
+        try:
+            if content is None:
+                self.__load()
+            else:
+                # Parse from memory instead of reading the file again
+                self.__use_content(content, _stat_key(self.__path_str))
+        except json.JSONDecodeError as e2:
+            # No need to check for strict here, we are already recovering
+            # because if strict = True JSONDeserializationError
+            # would have been raised.
+            logger.warning(
+                "Recovery also failed for '%s'. Falling back to empty object."
+                "Decoding error: %s",
+                self.__path,
+                e2,
+            )
+            self.__write_bytes("{}".encode(self.settings.encoding))
+            self.json = {}
+
+    def __load(self) -> None:
+        """
+        Load the file into :attr:`json` and remember which content was read.
+        The caller must hold ``_lock`` and ``_write_lock``.
+
+        :raises OSError: if the file cannot be read
+        :raises json.JSONDecodeError: if the file does not contain valid JSON
+        """
+        # stat before reading: if the file is replaced in between, the
+        # recorded state is outdated and the next save() will not be skipped
+        stat = _stat_key(self.__path_str)
+        with open(self.__path_str, "rb") as file:
+            data = file.read()
+        self.__use_content(data, stat)
+
+    def __use_content(self, data: bytes, stat: tuple[int, int, int] | None) -> None:
+        """
+        Parse the current content of the file into :attr:`json` and remember it.
+        The caller must hold ``_lock`` and ``_write_lock``.
+
+        :param data: Content of the file
+        :param stat: :func:`_stat_key` of the file holding data
+        :raises json.JSONDecodeError: if data is not valid JSON
+        """
+        self._disk_hash = _digest(data)
+        self._disk_stat = stat
+        self.json = _parse(data, self.settings)
 
     def reload(self, strict: bool = False, preserve: bool | None = None) -> None:
         """
@@ -436,18 +816,23 @@ class JSONFile:
             if file cannot be accessed (always)
         :raises ~singlejson.fileutils.DefaultNotJSONSerializableError:
             if strict is True and JSON is invalid
+        :raises Exception:
+            any error of an earlier save queued with ``async_save``,
+            see :meth:`flush`. Nothing is reloaded in that case.
         """
-        # Use the per-instance lock to guard load/recovery operations
-        with self._lock:
+        # Load what was saved last
+        self.flush()
+        # Use the per-instance locks to guard load/recovery operations
+        with self._lock, self._write_lock:
             actual_preserve = self.__preserve if preserve is None else preserve
             # 1: See if file exists
-            if not self.__path.exists():
-                # Create file with no data
-                self.restore_default(strict, preserve=actual_preserve)
-            # 2: File now surely exists
+            if not os.path.exists(self.__path_str):
+                # Create file with default data, this also loads it
+                self.__restore_default(strict, actual_preserve)
+                return
+            # 2: File exists
             try:
-                with self.__path.open("r", encoding=self.settings.encoding) as file:
-                    self.json = json_load(file)
+                self.__load()
             except (PermissionError, OSError) as e:
                 raise FileAccessError(f"Cannot read file '{self.__path}': {e}") from e
             except json.JSONDecodeError as e:
@@ -462,34 +847,143 @@ class JSONFile:
                     self.__path,
                     e,
                 )
-                self.restore_default(strict, preserve=actual_preserve)
+                self.__restore_default(strict, actual_preserve)
                 # Don't retry loading here; restore_default() now handles recovery
 
-    def save(self, settings: JsonSerializationSettings | None = None) -> None:
+    def save(
+        self,
+        settings: JsonSerializationSettings | None = None,
+        *,
+        durable: bool = False,
+    ) -> None:
         """
         Save the data to the disk (atomically by default).
+        The write is skipped if the file already contains the serialized data
+        (unless ``durable`` is set). If the file's inode, size and mtime are
+        unchanged since it was last read or written, its content is assumed to
+        be unchanged too. This is only relied on once the mtime is older than
+        the timestamp granularity of common filesystems (2 seconds); before
+        that, the file content is compared. Data that changed since the last
+        read or write is written without looking at the file.
 
         :param settings:
             :class:`JsonSerializationSettings` object
             (``None`` for instance settings)
+        :param durable:
+            Flush the file and its directory to disk before returning, so the
+            saved data survives a crash or power loss. Slower, off by default.
+            Always writes synchronously, even with ``async_save``.
+        :raises ~singlejson.fileutils.FileAccessError:
+            if the file cannot be written or the data cannot be encoded with
+            the configured encoding
+        :raises Exception:
+            with ``durable``, any error of an earlier save queued with
+            ``async_save``, see :meth:`flush`. Nothing is saved in that case.
         """
         settings = settings or self.settings
+        if durable:
+            # Queued older data must not be written after this save
+            self.flush()
         # guard save with the per-instance lock
         with self._lock:
+            # Serialize to bytes now: this is the snapshot that gets written,
+            # even if self.json is modified while an async write is pending
             try:
-                # Ensure directory exists
-                self.__path.parent.mkdir(parents=True, exist_ok=True)
-                # Serialize to text then atomically write
-                data_to_save = self.json
-                text = dumps(
-                    data_to_save,
-                    indent=settings.indent,
-                    sort_keys=settings.sort_keys,
-                    ensure_ascii=settings.ensure_ascii,
-                )
-                _atomic_write_text(self.__path, text, encoding=settings.encoding)
-            except (PermissionError, OSError) as e:
+                data = _dumps(self.json, settings)
+            except UnicodeEncodeError as e:
                 raise FileAccessError(f"Cannot write file '{self.__path}': {e}") from e
+            digest = _digest(data)
+            if self.__async_save and not durable:
+                with self._write_cond:
+                    self._pending = (data, digest)
+                    if self._writer is None:
+                        self._writer = threading.Thread(
+                            target=self.__writer_loop,
+                            name=f"singlejson writer ({self.__path.name})",
+                        )
+                        self._writer.start()
+                return
+            with self._write_lock:
+                self.__store(data, digest, durable)
+
+    def __store(self, data: bytes, digest: bytes, durable: bool = False) -> None:
+        """
+        Write serialized data to the file unless it already holds it.
+        The caller must hold ``_write_lock``.
+
+        :param data: serialized data
+        :param digest: :func:`_digest` of data
+        :param durable: see :meth:`save`
+        :raises ~singlejson.fileutils.FileAccessError: if the file cannot be written
+        """
+        try:
+            stat = _stat_key(self.__path_str)
+            if durable:
+                # Existing content may not have been flushed, always write
+                pass
+            elif digest != self._disk_hash:
+                # Data changed since the file was last read or written
+                pass
+            elif stat is not None and stat == self._disk_stat:
+                # File unchanged since it was last read or written
+                return
+            elif _has_content(self.__path_str, data, digest):
+                # Recently written or touched by someone else, but unchanged
+                self._disk_stat = stat
+                return
+            self.__write_bytes(data, durable=durable)
+            self._disk_hash = digest
+            self._disk_stat = _stat_key(self.__path_str)
+        except (PermissionError, OSError) as e:
+            raise FileAccessError(f"Cannot write file '{self.__path}': {e}") from e
+
+    def __writer_loop(self) -> None:
+        """
+        Write queued snapshots until none are left, then exit.
+        The thread is not a daemon, so pending data is written before the
+        interpreter exits. Errors are kept for :meth:`flush` to raise.
+        """
+        try:
+            while True:
+                with self._write_cond:
+                    pending = self._pending
+                    self._pending = None
+                    if pending is None:
+                        # Cleared together with the check, so save() starts a
+                        # new writer for anything queued after this point
+                        self._writer = None
+                        self._write_cond.notify_all()
+                        return
+                try:
+                    with self._write_lock:
+                        self.__store(*pending)
+                except Exception as e:
+                    logger.error("Asynchronous save of '%s' failed: %s", self.__path, e)
+                    with self._write_cond:
+                        self._write_error = e
+        finally:
+            with self._write_cond:
+                if self._writer is threading.current_thread():
+                    # Stopped unexpectedly, don't leave flush() waiting
+                    self._writer = None
+                    self._write_cond.notify_all()
+
+    def flush(self) -> None:
+        """
+        Wait until all saves queued with ``async_save`` are written.
+        Returns immediately if nothing is pending.
+
+        :raises ~singlejson.fileutils.FileAccessError:
+            if a queued save could not be written
+        :raises Exception:
+            any other error raised while writing a queued save
+        """
+        with self._write_cond:
+            while self._writer is not None:
+                self._write_cond.wait()
+            error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
 
     # Context manager support
     def __enter__(self) -> JSONFile:
@@ -522,3 +1016,7 @@ class JSONFile:
 DEFAULT_SERIALIZATION_SETTINGS = JsonSerializationSettings()
 """Default JsonSerializationSettings used by JSONFile instances
 with indent=4, sort_keys=True, ensure_ascii=False"""
+
+FAST_SERIALIZATION_SETTINGS = JsonSerializationSettings(indent=None, sort_keys=False)
+"""JsonSerializationSettings trading readability for speed:
+compact output (indent=None) in insertion order (sort_keys=False)"""
@@ -27,6 +27,7 @@ def load(
     preserve: bool | None = None,
     strict: bool = False,
     load_file: bool = True,
+    async_save: bool = False,
 ) -> JSONFile:
     """
     Open a new JSONFile and add it to the pool.
@@ -53,6 +54,9 @@ def load(
     :param load_file:
         True by default, causes file to be loaded on init.
         Set to False to suppress loading.
+    :param async_save:
+        If True, saves are written by a background thread,
+        see :class:`~singlejson.fileutils.JSONFile`.
 
     :raises ~singlejson.fileutils.FileAccessError:
         if file cannot be accessed (always)
@@ -77,20 +81,53 @@ def load(
                 settings=settings,
                 strict=strict,
                 load_file=load_file,
+                async_save=async_save,
             )
             _file_pool[key] = jsonfile
         return _file_pool[key]
 
 
+def _save_and_flush(files: list[JSONFile]) -> None:
+    """
+    Save files and wait until they are written, continuing past errors.
+
+    :param files: Files to save
+    :raises Exception: the first error raised while saving or flushing
+    """
+    error: Exception | None = None
+    for file in files:
+        try:
+            file.save()
+        except Exception as e:
+            error = error or e
+    # Files using async_save are written in the background, wait for all
+    for file in files:
+        try:
+            file.flush()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
 def sync() -> None:
     """
-    Sync all pooled files to the filesystem.
+    Sync all pooled files to the filesystem and wait until they are written.
+    Files whose data did not change since their last save are not rewritten.
     If you wish to adjust settings, change the default
     or change the JsonFile.settings property.
+
+    :raises ~singlejson.fileutils.FileAccessError:
+        if a file cannot be written. All other files are still synced.
+    :raises Exception:
+        any error of an earlier save queued with ``async_save``,
+        see :meth:`~singlejson.fileutils.JSONFile.flush`
     """
     with _pool_lock:
-        for file in list(_file_pool.values()):
-            file.save()
+        files = list(_file_pool.values())
+    # Save outside the pool lock so load() calls are not blocked by disk IO;
+    # every JSONFile guards its own writes.
+    _save_and_flush(files)
 
 
 def reset() -> None:
@@ -107,16 +144,24 @@ def close(path: PathOrSimilar | None = None, *, save: bool = True) -> None:
 
     :param path: The path of the file to close.
     :param save: Whether to save the file or not.
+    :raises ~singlejson.fileutils.FileAccessError:
+        if a file cannot be written. All other files are still saved and
+        the files are closed anyway.
+    :raises Exception:
+        if saving, any error of an earlier save queued with ``async_save``,
+        see :meth:`~singlejson.fileutils.JSONFile.flush`
     """
     with _pool_lock:
         if path is None:
             # Close all
-            if save:
-                for file in list(_file_pool.values()):
-                    file.save()
-            _file_pool.clear()
+            try:
+                if save:
+                    _save_and_flush(list(_file_pool.values()))
+            finally:
+                _file_pool.clear()
         else:
             p = abs_filename(path)
             jf = _file_pool.pop(p, None)
             if jf and save:
                 jf.save()
+                jf.flush()
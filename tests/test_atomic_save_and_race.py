@@ -87,3 +87,24 @@ def test_copy_default_file_race(tmp_path: Path):
 
     p.join()
     assert p.exitcode == 0
+
+
+def test_durable_save_flushes(tmp_path: Path, monkeypatch):
+    import os
+
+    synced = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    if hasattr(os, "fdatasync"):
+        monkeypatch.setattr(os, "fdatasync", synced.append)
+
+    p = tmp_path / "durable.json"
+    jf = JSONFile(p, default_data={})
+    assert synced == []
+    jf.json["a"] = 1
+    jf.save(durable=True)
+    assert synced
+    # durable saves are never skipped
+    synced.clear()
+    jf.save(durable=True)
+    assert synced
+    assert json.loads(p.read_text(encoding="utf-8")) == {"a": 1}
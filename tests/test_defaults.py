@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -174,3 +175,102 @@ def test_restore_default_strict_mode(tmp_path: Path):
     jf_with_path.restore_default(strict=False)
     # Should not throw an error and revert to {} since cannot set json to malformed
     assert jf_with_path.json == {}
+
+
+def test_default_file_copy_leaves_no_temp_files(tmp_path: Path):
+    template = tmp_path / "template.json"
+    content = {"data": ["x" * 100] * 1000}
+    template.write_text(json.dumps(content), encoding="utf-8")
+
+    dest = tmp_path / "sub" / "dest.json"
+    jf = JSONFile(dest, default_path=template)
+
+    assert dest.read_bytes() == template.read_bytes()
+    assert jf.json == content
+    # No temporary files are left behind
+    assert [p.name for p in dest.parent.iterdir()] == ["dest.json"]
+
+
+def test_restore_default_skips_identical_file(tmp_path: Path):
+    template = tmp_path / "template.json"
+    template.write_text('{"a": 1}', encoding="utf-8")
+    by_path = tmp_path / "by_path.json"
+    by_data = tmp_path / "by_data.json"
+    jf_path = JSONFile(by_path, default_path=template)
+    jf_data = JSONFile(by_data, default_data={"a": 1})
+
+    inodes = (by_path.stat().st_ino, by_data.stat().st_ino)
+    jf_path.restore_default(preserve=True)
+    jf_data.restore_default(preserve=True)
+    # Files already held the default: not replaced and no backups made
+    assert (by_path.stat().st_ino, by_data.stat().st_ino) == inodes
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "by_data.json",
+        "by_path.json",
+        "template.json",
+    ]
+
+    # Changing the template must be picked up
+    template.write_text('{"a": 22}', encoding="utf-8")
+    jf_path.restore_default()
+    assert jf_path.json == {"a": 22}
+
+
+def test_strict_default_file_is_not_copied_again(tmp_path: Path, monkeypatch):
+    from singlejson import fileutils
+
+    template = tmp_path / "template.json"
+    template.write_text('{"a": 1}', encoding="utf-8")
+    dest = tmp_path / "dest.json"
+
+    def fail(*args):
+        raise AssertionError("validated default should be written from memory")
+
+    monkeypatch.setattr(fileutils, "_atomic_copy_file", fail)
+    jf = JSONFile(dest, default_path=template, strict=True)
+    assert jf.json == {"a": 1}
+    assert json.loads(dest.read_text(encoding="utf-8")) == {"a": 1}
+
+    # Edits to the template are still picked up
+    template.write_text('{"a": 2, "b": 3}', encoding="utf-8")
+    jf.restore_default(strict=True)
+    assert jf.json == {"a": 2, "b": 3}
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_same_size_template_edit_within_mtime_tick(tmp_path: Path, strict: bool):
+    template = tmp_path / "template.json"
+    template.write_text('{"a": 1}', encoding="utf-8")
+    dest = tmp_path / "dest.json"
+    jf = JSONFile(dest, default_path=template, strict=strict)
+    jf.restore_default(strict=strict)
+
+    # In-place edit of the same size, mtime restored as on a coarse filesystem
+    st = template.stat()
+    template.write_text('{"a": 2}', encoding="utf-8")
+    os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns))
+    jf.restore_default(strict=strict)
+    assert jf.json == {"a": 2}
+    assert dest.read_bytes() == template.read_bytes()
+
+
+def test_old_template_is_read_once(tmp_path: Path, monkeypatch):
+    from singlejson import fileutils
+
+    template = tmp_path / "template.json"
+    template.write_text('{"a": 1}', encoding="utf-8")
+    old = template.stat().st_mtime_ns - 10 * fileutils._MTIME_GRANULARITY_NS
+    os.utime(template, ns=(old, old))
+    dest = tmp_path / "dest.json"
+    jf = JSONFile(dest, default_path=template, strict=True)
+
+    real_open = open
+
+    def guarded_open(file, *args, **kwargs):
+        assert os.fspath(file) != os.fspath(template), "template read again"
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", guarded_open)
+    jf.restore_default(strict=True)
+    jf.restore_default()
+    assert jf.json == {"a": 1}
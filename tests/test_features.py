@@ -80,3 +80,120 @@ def test_serialization_settings_indent_and_sort(tmp_path: Path):
     # a should come before b when sorted
     assert '\n  "a"' in text
     assert '\n  "b"' in text
+
+
+def test_save_skips_unchanged_data(tmp_path: Path):
+    p = tmp_path / "unchanged.json"
+    jf = JSONFile(p, default_data={})
+    jf.json["a"] = 1
+    jf.save()
+    inode = p.stat().st_ino
+    jf.save()
+    # No rewrite happened, so the file was not replaced
+    assert p.stat().st_ino == inode
+
+    # External modification must be overwritten on the next save
+    p.write_text('{"a": 2}', encoding="utf-8")
+    jf.save()
+    assert json.loads(p.read_text(encoding="utf-8")) == {"a": 1}
+
+
+def test_save_detects_same_size_edit_within_mtime_tick(tmp_path: Path):
+    p = tmp_path / "tick.json"
+    jf = JSONFile(p, default_data={"a": 1})
+    st = p.stat()
+    # In-place edit of the same size, mtime restored as on a coarse filesystem
+    p.write_bytes(p.read_bytes().replace(b"1", b"2"))
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    jf.save()
+    assert json.loads(p.read_text(encoding="utf-8")) == {"a": 1}
+
+
+def test_save_trusts_stat_of_old_file(tmp_path: Path, monkeypatch):
+    from singlejson import fileutils
+
+    p = tmp_path / "old.json"
+    p.write_text(json.dumps({"a": 1}, indent=4), encoding="utf-8")
+    old = p.stat().st_mtime_ns - 10 * fileutils._MTIME_GRANULARITY_NS
+    os.utime(p, ns=(old, old))
+    jf = JSONFile(p)
+
+    def fail(*args):
+        raise AssertionError("file content was read")
+
+    # Unchanged inode, size and mtime: skipped without reading the file
+    monkeypatch.setattr(fileutils, "_has_content", fail)
+    jf.save()
+
+
+def test_save_writes_changed_data_without_reading(tmp_path: Path, monkeypatch):
+    from singlejson import fileutils
+
+    p = tmp_path / "changed.json"
+    jf = JSONFile(p, default_data={"a": 1})
+
+    def fail(*args):
+        raise AssertionError("file content was read")
+
+    monkeypatch.setattr(fileutils, "_has_content", fail)
+    for i in range(3):
+        # Same size, written within one mtime tick
+        jf.json["a"] = i
+        jf.save()
+        assert json.loads(p.read_text(encoding="utf-8")) == {"a": i}
+
+
+def test_save_recreates_removed_directory(tmp_path: Path):
+    d = tmp_path / "nested" / "dir"
+    p = d / "file.json"
+    jf = JSONFile(p, default_data={})
+    p.unlink()
+    d.rmdir()
+    jf.json["k"] = 1
+    jf.save()
+    assert json.loads(p.read_text(encoding="utf-8")) == {"k": 1}
+
+
+def test_reload_recreates_removed_directory_from_default_file(tmp_path: Path):
+    template = tmp_path / "template.json"
+    template.write_text('{"a": 1}', encoding="utf-8")
+    d = tmp_path / "sub"
+    p = d / "f.json"
+    jf = JSONFile(p, default_path=template)
+    p.unlink()
+    d.rmdir()
+    jf.reload()
+    assert jf.json == {"a": 1}
+    assert p.read_bytes() == template.read_bytes()
+
+
+def test_save_after_load_skips_identical_content(tmp_path: Path):
+    p = tmp_path / "loaded.json"
+    p.write_text(json.dumps({"a": 1}, indent=4), encoding="utf-8")
+    jf = JSONFile(p)
+    inode = p.stat().st_ino
+    jf.save()
+    # Serialized data equals the file content: nothing is rewritten
+    assert p.stat().st_ino == inode
+    jf.json["a"] = 2
+    jf.save()
+    assert p.stat().st_ino != inode
+    assert json.loads(p.read_text(encoding="utf-8")) == {"a": 2}
+
+
+def test_big_integers_roundtrip(tmp_path: Path):
+    p = tmp_path / "big.json"
+    big = 2**64 + 1
+    p.write_text(json.dumps({"id": big}), encoding="utf-8")
+    jf = JSONFile(p)
+    assert jf.json["id"] == big
+    jf.json["x"] = 1
+    jf.save()
+    assert json.loads(p.read_text(encoding="utf-8"))["id"] == big
+
+
+def test_invalid_number_restores_default(tmp_path: Path):
+    p = tmp_path / "damaged.json"
+    p.write_text('{"a": [01]}', encoding="utf-8")
+    jf = JSONFile(p, default_data={"a": []})
+    assert jf.json == {"a": []}
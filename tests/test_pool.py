@@ -1,7 +1,9 @@
 import json
 
-from singlejson.fileutils import JSONFile
-from singlejson.pool import load, reset, sync
+import pytest
+
+from singlejson.fileutils import FileAccessError, JSONFile
+from singlejson.pool import close, load, reset, sync
 
 
 def test_pool(tmp_path):
@@ -38,3 +40,36 @@ def test_pool_load_preserve(tmp_path):
     assert preserved.exists()
     assert preserved.read_text(encoding="utf-8") == "{ invalid json"
     reset()
+
+
+def test_abs_filename_follows_working_directory(tmp_path, monkeypatch):
+    from singlejson.fileutils import abs_filename
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    monkeypatch.chdir(tmp_path / "a")
+    first = abs_filename("file.json")
+    monkeypatch.chdir(tmp_path / "b")
+    # Cached resolution must not leak across working directories
+    assert abs_filename("file.json") != first
+    assert abs_filename("file.json") == (tmp_path / "b" / "file.json").resolve()
+
+
+def test_close_flushes_all_files_despite_errors(tmp_path):
+    reset()
+    broken_path = tmp_path / "sub" / "broken.json"
+    broken = load(broken_path, default_data={}, async_save=True)
+    good_path = tmp_path / "good.json"
+    good = load(good_path, default_data={}, async_save=True)
+    # Replace the parent directory by a file so writes fail
+    broken_path.unlink()
+    broken_path.parent.rmdir()
+    broken_path.parent.write_text("not a directory")
+    broken.json["a"] = 1
+    good.json["a"] = 1
+    with pytest.raises(FileAccessError):
+        close()
+    assert json.loads(good_path.read_text(encoding="utf-8")) == {"a": 1}
+    # The pool was cleared anyway
+    assert load(good_path) is not good
+    reset()
@@ -1,7 +1,13 @@
+import json
+import uuid
 from pathlib import Path
 
+import pytest
+
 import singlejson
 from singlejson.fileutils import (
+    DefaultNotJSONSerializableError,
+    FileAccessError,
     JSONFile,
     JsonSerializationSettings,
 )
@@ -107,3 +113,81 @@ def test_default_settings_are_used_when_not_overridden(tmp_path: Path):
     text = read_text(p)
     # Expect defaults: indent=4 and sort_keys=True per DEFAULT_SERIALIZATION_SETTINGS
     assert '\n    "a"' in text and text.index('\n    "a"') < text.index('\n    "b"')
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_output_matches_stdlib_json(tmp_path: Path, indent: int | None):
+    # Output must not depend on optional JSON packages being installed
+    p = tmp_path / "stdlib.json"
+    settings = JsonSerializationSettings(indent=indent, sort_keys=True)
+    data = {
+        "b": [1, 2.5, {}],
+        "a": {"z": None, "ä": "hällo"},
+        "c": [],
+        "floats": [1e16, 1e-7, float("nan"), float("inf"), float("-inf")],
+    }
+    jf = JSONFile(p, default_data={}, settings=settings)
+    jf.json = data
+    jf.save()
+    assert read_text(p) == json.dumps(
+        data, indent=indent, sort_keys=True, ensure_ascii=False
+    )
+
+
+def test_unserializable_types_are_rejected(tmp_path: Path):
+    p = tmp_path / "uuid.json"
+    jf = JSONFile(p, default_data={}, settings=JsonSerializationSettings(indent=2))
+    jf.json = {"id": uuid.uuid4()}
+    with pytest.raises(TypeError):
+        jf.save()
+
+
+def test_non_string_keys_are_serialized(tmp_path: Path):
+    p = tmp_path / "int_keys.json"
+    jf = JSONFile(p, default_data={}, settings=JsonSerializationSettings(indent=2))
+    jf.json = {1: "one"}
+    jf.save()
+    assert json.loads(read_text(p)) == {"1": "one"}
+
+
+def test_non_utf8_encoding_roundtrip(tmp_path: Path):
+    p = tmp_path / "latin1.json"
+    settings = JsonSerializationSettings(encoding="latin-1")
+    jf = JSONFile(p, default_data={}, settings=settings)
+    jf.json = {"greet": "hällo"}
+    jf.save()
+    assert p.read_bytes().decode("latin-1").count("hällo") == 1
+    jf2 = JSONFile(p, settings=settings)
+    assert jf2.json == {"greet": "hällo"}
+
+
+def test_unencodable_data_raises_file_access_error(tmp_path: Path):
+    p = tmp_path / "latin1.json"
+    settings = JsonSerializationSettings(encoding="latin-1")
+    jf = JSONFile(p, default_data={}, settings=settings)
+    jf.json = {"price": "5 €"}
+    with pytest.raises(FileAccessError):
+        jf.save()
+    assert json.loads(p.read_bytes().decode("latin-1")) == {}
+
+
+def test_unencodable_string_default(tmp_path: Path):
+    p = tmp_path / "latin1_default.json"
+    settings = JsonSerializationSettings(encoding="latin-1")
+    # Not strict: falls back to an empty object
+    jf = JSONFile(p, default_data='{"price": "5 €"}', settings=settings)
+    assert jf.json == {}
+    p.unlink()
+    with pytest.raises(DefaultNotJSONSerializableError):
+        JSONFile(p, default_data='{"price": "5 €"}', settings=settings, strict=True)
+
+
+def test_fast_settings_compact_insertion_order(tmp_path: Path):
+    p = tmp_path / "fast.json"
+    jf = JSONFile(p, default_data={}, settings=singlejson.FAST_SERIALIZATION_SETTINGS)
+    jf.json = {"b": 2, "a": 1}
+    jf.save()
+    text = read_text(p)
+    assert "\n" not in text
+    assert text.index('"b"') < text.index('"a"')
+    assert json.loads(text) == {"b": 2, "a": 1}
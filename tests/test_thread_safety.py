@@ -1,7 +1,9 @@
 import json
 import threading
 
-from singlejson.fileutils import JSONFile
+import pytest
+
+from singlejson.fileutils import FileAccessError, JSONFile
 
 
 def worker_save(jf: JSONFile, key: str, value, iterations: int = 50):
@@ -63,3 +65,86 @@ def test_pool_thread_safety(tmp_path):
 
     # all returned objects should be the same instance
     assert all(r is results[0] for r in results)
+
+
+def test_async_save_coalesces_and_flushes(tmp_path):
+    p = tmp_path / "async.json"
+    jf = JSONFile(p, default_data={}, async_save=True)
+    for i in range(100):
+        jf.json["i"] = i
+        jf.save()
+    # The snapshot is taken on save, later mutations are not written
+    jf.json["i"] = -1
+    jf.flush()
+    assert json.loads(p.read_text(encoding="utf-8")) == {"i": 99}
+    # reload waits for pending writes
+    jf.json["i"] = 100
+    jf.save()
+    jf.reload()
+    assert jf.json == {"i": 100}
+
+
+def test_async_save_error_raised_on_flush(tmp_path):
+    p = tmp_path / "sub" / "async.json"
+    jf = JSONFile(p, default_data={}, async_save=True)
+    # Replace the parent directory by a file so writes fail
+    p.unlink()
+    p.parent.rmdir()
+    p.parent.write_text("not a directory")
+    jf.json["a"] = 1
+    jf.save()
+    with pytest.raises(FileAccessError):
+        jf.flush()
+    # Error is reported once
+    jf.flush()
+
+
+def test_async_save_does_not_wait_for_running_write(tmp_path, monkeypatch):
+    from singlejson import fileutils
+
+    p = tmp_path / "slow.json"
+    jf = JSONFile(p, default_data={}, async_save=True)
+    started = threading.Event()
+    release = threading.Event()
+    original = fileutils._atomic_write_bytes
+
+    def slow_write(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        original(*args, **kwargs)
+
+    monkeypatch.setattr(fileutils, "_atomic_write_bytes", slow_write)
+    jf.json["i"] = 1
+    jf.save()
+    assert started.wait(5)
+    # The writer is busy: queuing the next snapshot must not block
+    jf.json["i"] = 2
+    saver = threading.Thread(target=jf.save)
+    saver.start()
+    saver.join(2)
+    blocked = saver.is_alive()
+    release.set()
+    jf.flush()
+    assert not blocked
+    assert json.loads(p.read_text(encoding="utf-8")) == {"i": 2}
+
+
+def test_async_save_unexpected_error_raised_on_flush(tmp_path, monkeypatch):
+    from singlejson import fileutils
+
+    p = tmp_path / "broken.json"
+    jf = JSONFile(p, default_data={}, async_save=True)
+
+    def broken_write(*args, **kwargs):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(fileutils, "_atomic_write_bytes", broken_write)
+    jf.json["a"] = 1
+    jf.save()
+    with pytest.raises(RuntimeError):
+        jf.flush()
+    # The writer is restarted by the next save
+    monkeypatch.undo()
+    jf.save()
+    jf.flush()
+    assert json.loads(p.read_text(encoding="utf-8")) == {"a": 1}